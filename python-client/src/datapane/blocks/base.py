@@ -8,8 +8,6 @@ from __future__ import annotations
 import typing as t
 from abc import ABC
 
-from lxml.builder import ElementMaker
-
 from datapane.client import DPClientError, log
 from datapane.common.viewxml_utils import is_valid_id, mk_attribs
 
@@ -19,9 +17,6 @@ if t.TYPE_CHECKING:
     from datapane.blocks import Block
     from datapane.view import ViewVisitor
 
-E = ElementMaker()  # XML Tag Factory
-
-
 BlockId = str
 
 VV = t.TypeVar("VV", bound="ViewVisitor")
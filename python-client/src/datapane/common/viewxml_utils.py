@@ -62,14 +62,12 @@ def conv_attrib(v: t.Any) -> t.Optional[str]:
     elif isinstance(v, str):
         return v
     elif isinstance(v, Number) and type(v) != bool:
-        if math.isinf(v) and v > 0:
-            return "INF"
-        elif math.isinf(v) and v < 0:
-            return "-INF"
+        if math.isfinite(v):
+            return str(v)
         elif math.isnan(v):
             return "NaN"
         else:
-            return str(v)
+            return "INF" if v > 0 else "-INF"
     else:
         return json.dumps(v)
 
@@ -65,8 +65,7 @@ class XMLBuilder(ViewVisitor):
     @multimethod
     def visit(self, b: BaseBlock) -> XMLBuilder:
         """Base implementation - just created an empty tag including all the initial attributes"""
-        _E = getattr(E, b._tag)
-        return self.add_element(b, _E(**b._attributes))
+        return self.add_element(b, etree.Element(b._tag, attrib=b._attributes))
 
     def _visit_subnodes(self, b: ContainerBlock) -> t.List[ElementT]:
         cur_elements = self.elements
@@ -80,8 +79,8 @@ class XMLBuilder(ViewVisitor):
     def visit(self, b: ContainerBlock) -> XMLBuilder:
         sub_elements = self._visit_subnodes(b)
         # build the element
-        _E = getattr(E, b._tag)
-        element = _E(*sub_elements, **b._attributes)
+        element = etree.Element(b._tag, attrib=b._attributes)
+        element.extend(sub_elements)
         return self.add_element(b, element)
 
     @multimethod
@@ -97,23 +96,25 @@ class XMLBuilder(ViewVisitor):
     @multimethod
     def visit(self, b: EmbeddedTextBlock) -> XMLBuilder:
         # NOTE - do we use etree.CDATA wrapper?
-        _E = getattr(E, b._tag)
-        return self.add_element(b, _E(etree.CDATA(b.content), **b._attributes))
+        element = etree.Element(b._tag, attrib=b._attributes)
+        element.text = etree.CDATA(b.content)
+        return self.add_element(b, element)
 
     @multimethod
     def visit(self, b: AssetBlock):
         """Main XMl creation method - visitor method"""
         fe = self._add_asset_to_store(b)
 
-        _E = getattr(E, b._tag)
-
-        e: etree._Element = _E(
-            type=fe.mime,
-            # size=conv_attrib(fe.size),
-            # hash=fe.hash,
-            **{**b._attributes, **b.get_file_attribs()},
-            # src=f"attachment://{self.store_count}",
-            src=f"ref://{fe.hash}",
+        e: etree._Element = etree.Element(
+            b._tag,
+            attrib=dict(
+                type=fe.mime,
+                # size=conv_attrib(fe.size),
+                # hash=fe.hash,
+                **{**b._attributes, **b.get_file_attribs()},
+                # src=f"attachment://{self.store_count}",
+                src=f"ref://{fe.hash}",
+            ),
         )
 
         if b.caption:
@@ -3,6 +3,7 @@ from packaging.version import Version
 
 from datapane.common import versioning as v
 from datapane.common.utils import should_compress_mime_type_for_upload
+from datapane.common.viewxml_utils import conv_attrib
 
 
 def test_version():
@@ -43,3 +44,22 @@ def test_version():
 )
 def test_should_compress_mime_type(mime_type, value):
     assert should_compress_mime_type_for_upload(mime_type) == value
+
+
+@pytest.mark.parametrize(
+    "x, value",
+    [
+        (None, None),
+        ("", None),
+        ("a", "a"),
+        (1, "1"),
+        (1.5, "1.5"),
+        (float("inf"), "INF"),
+        (float("-inf"), "-INF"),
+        (float("nan"), "NaN"),
+        (True, "true"),
+        ([1, 2], "[1, 2]"),
+    ],
+)
+def test_conv_attrib(x, value):
+    assert conv_attrib(x) == value